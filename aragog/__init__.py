@@ -20,9 +20,12 @@ from __future__ import annotations
 
 __version__: str = "0.1.0-alpha"
 
+import atexit
 import importlib.resources
 import logging
+import queue
 from importlib.abc import Traversable
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 
 CFG_DATA: Traversable = importlib.resources.files(f"{__package__}.cfg")
 
@@ -31,6 +34,9 @@ CFG_DATA: Traversable = importlib.resources.files(f"{__package__}.cfg")
 logger: logging.Logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# Listener that passes records from the package logger to the handlers of debug_file_logger
+_queue_listener: QueueListener | None = None
+
 
 def complex_formatter() -> logging.Formatter:
     """Complex formatter for logging
@@ -79,9 +85,16 @@ def debug_logger() -> logging.Logger:
 def debug_file_logger() -> logging.Logger:
     """Sets up info logging to the console and debug logging to a file.
 
+    The package logger only puts records on a queue and the console and file handlers are called
+    by a listener on a separate thread, so logging does not block on I/O. Records for the file are
+    also buffered and written in batches.
+
     Returns:
         A logger
     """
+    global _queue_listener  # pylint: disable=global-statement
+
+    _stop_queue_listener()
     # Console logger
     package_logger: logging.Logger = logging.getLogger(__name__)
     package_logger.setLevel(logging.DEBUG)
@@ -90,16 +103,40 @@ def debug_file_logger() -> logging.Logger:
     console_formatter: logging.Formatter = simple_formatter()
     console_handler.setFormatter(console_formatter)
     console_handler.setLevel(logging.INFO)
-    logger.addHandler(console_handler)
     # File logger
     file_handler: logging.Handler = logging.FileHandler(f"{__package__}.log")
     file_formatter: logging.Formatter = complex_formatter()
     file_handler.setFormatter(file_formatter)
     file_handler.setLevel(logging.DEBUG)
-    package_logger.addHandler(file_handler)
+    buffered_file_handler: logging.Handler = MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=file_handler
+    )
+    buffered_file_handler.setLevel(logging.DEBUG)
+    # Queue
+    log_queue: queue.Queue = queue.Queue(-1)
+    package_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(
+        log_queue, console_handler, buffered_file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
 
     return package_logger
 
 
+@atexit.register
+def _stop_queue_listener() -> None:
+    """Stops the listener of debug_file_logger, if any, and flushes its handlers.
+
+    Stopping the listener processes any remaining records on the queue.
+    """
+    global _queue_listener  # pylint: disable=global-statement
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
 # Expose public API so pylint: disable = C0413
 from aragog.solver import Solver
@@ -20,7 +20,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 import numpy as np
 
@@ -51,6 +51,17 @@ class BoundaryConditions:
 
     def __post_init__(self):
         self._settings: _BoundaryConditionsParameters = self._parameters.boundary_conditions
+        # Constant factors of the grey-body flux, which are precomputed because the boundary
+        # conditions are applied for every evaluation of the right-hand side
+        self._grey_body_prefactor: float = (
+            self._settings.emissivity * self._parameters.scalings.stefan_boltzmann_constant
+        )
+        self._equilibrium_temperature_fourth_power: float = (
+            self._settings.equilibrium_temperature**4
+        )
+        # Resolve the flux boundary conditions once rather than for every application
+        self._apply_inner: Callable[[State], None] = self._get_inner_boundary_condition()
+        self._apply_outer: Callable[[State], None] = self._get_outer_boundary_condition()
 
     def conform_temperature_boundary_conditions(
         self, temperature: np.ndarray, temperature_basic: np.ndarray, dTdr: np.ndarray
@@ -83,17 +94,13 @@ class BoundaryConditions:
         Args:
             state: The state to apply the boundary conditions to
         """
-        self.apply_inner_boundary_condition(state)
-        self.apply_outer_boundary_condition(state)
+        self._apply_inner(state)
+        self._apply_outer(state)
         logger.debug("temperature = %s", state.temperature_basic)
         logger.debug("heat_flux = %s", state.heat_flux)
 
-    # TODO: Rename to only be associated with flux boundary conditions
-    def apply_outer_boundary_condition(self, state: State) -> None:
-        """Applies the outer boundary condition to the state.
-
-        Args:
-            state: The state to apply the boundary conditions to
+    def _get_outer_boundary_condition(self) -> Callable[[State], None]:
+        """Gets the function that applies the outer boundary condition to the state.
 
         Equivalent to SURFACE_BC in C code.
             1: Grey-body atmosphere
@@ -101,24 +108,31 @@ class BoundaryConditions:
             3: Couple to atmodeller
             4: Prescribed heat flux
             5: Prescribed temperature
+
+        Returns:
+            The function that applies the outer boundary condition
+
+        Raises:
+            NotImplementedError: If the outer boundary condition is not implemented
+            ValueError: If the outer boundary condition is unknown
         """
-        if self._settings.outer_boundary_condition == 1:
-            self.grey_body(state)
-        elif self._settings.outer_boundary_condition == 2:
+        outer_boundary_condition: int = self._settings.outer_boundary_condition
+        if outer_boundary_condition == 2:
             raise NotImplementedError
-        elif self._settings.outer_boundary_condition == 3:
+        if outer_boundary_condition == 3:
             msg: str = "Requires coupling to atmodeller"
             logger.error(msg)
             raise NotImplementedError(msg)
-        elif self._settings.outer_boundary_condition == 4:
-            state.heat_flux[-1, :] = self._settings.outer_boundary_value
-        elif self._settings.outer_boundary_condition == 5:
-            pass
-        else:
-            msg: str = (
-                f"outer_boundary_condition = {self._settings.outer_boundary_condition} is unknown"
-            )
-            raise ValueError(msg)
+        handlers: dict[int, Callable[[State], None]] = {
+            1: self.grey_body,
+            4: self._prescribe_outer_heat_flux,
+            5: self._keep_heat_flux,
+        }
+        try:
+            return handlers[outer_boundary_condition]
+        except KeyError:
+            msg = f"outer_boundary_condition = {outer_boundary_condition} is unknown"
+            raise ValueError(msg) from None
 
     def grey_body(self, state: State) -> None:
         """Applies a grey body flux at the surface.
@@ -126,36 +140,59 @@ class BoundaryConditions:
         Args:
             state: The state to apply the boundary conditions to
         """
-        state.heat_flux[-1, :] = (
-            self._settings.emissivity
-            * self._settings.scalings_.stefan_boltzmann_constant
-            * (np.power(state.top_temperature, 4) - self._settings.equilibrium_temperature**4)
+        top_temperature_squared: np.ndarray = np.square(state.top_temperature)
+        state.heat_flux[-1, :] = self._grey_body_prefactor * (
+            top_temperature_squared * top_temperature_squared
+            - self._equilibrium_temperature_fourth_power
         )
 
-    # TODO: Rename to only be associated with flux boundary conditions
-    def apply_inner_boundary_condition(self, state: State) -> None:
-        """Applies the inner boundary condition to the state.
+    def _prescribe_outer_heat_flux(self, state: State) -> None:
+        """Applies a prescribed heat flux at the surface.
 
         Args:
             state: The state to apply the boundary conditions to
+        """
+        state.heat_flux[-1, :] = self._settings.outer_boundary_value
+
+    def _prescribe_inner_heat_flux(self, state: State) -> None:
+        """Applies a prescribed heat flux at the core-mantle boundary.
+
+        Args:
+            state: The state to apply the boundary conditions to
+        """
+        state.heat_flux[0, :] = self._settings.inner_boundary_value
+
+    @staticmethod
+    def _keep_heat_flux(_state: State) -> None:
+        """Leaves the heat flux unchanged for a prescribed temperature."""
+
+    def _get_inner_boundary_condition(self) -> Callable[[State], None]:
+        """Gets the function that applies the inner boundary condition to the state.
 
         Equivalent to CORE_BC in C code.
             1: Simple core cooling
             2: Prescribed heat flux
             3: Prescribed temperature
+
+        Returns:
+            The function that applies the inner boundary condition
+
+        Raises:
+            NotImplementedError: If the inner boundary condition is not implemented
+            ValueError: If the inner boundary condition is unknown
         """
-        if self._settings.inner_boundary_condition == 1:
+        inner_boundary_condition: int = self._settings.inner_boundary_condition
+        if inner_boundary_condition == 1:
             raise NotImplementedError
-        elif self._settings.inner_boundary_condition == 2:
-            state.heat_flux[0, :] = self._settings.inner_boundary_value
-        elif self._settings.inner_boundary_condition == 3:
-            pass
-            # raise NotImplementedError
-        else:
-            msg: str = (
-                f"inner_boundary_condition = {self._settings.inner_boundary_condition} is unknown"
-            )
-            raise ValueError(msg)
+        handlers: dict[int, Callable[[State], None]] = {
+            2: self._prescribe_inner_heat_flux,
+            3: self._keep_heat_flux,
+        }
+        try:
+            return handlers[inner_boundary_condition]
+        except KeyError:
+            msg: str = f"inner_boundary_condition = {inner_boundary_condition} is unknown"
+            raise ValueError(msg) from None
 
 
 @dataclass
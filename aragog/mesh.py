@@ -23,6 +23,7 @@ from dataclasses import dataclass, field
 from functools import cached_property
 
 import numpy as np
+from scipy.sparse import csr_array
 
 from aragog.parser import Parameters, _MeshParameters
 from aragog.utilities import FloatOrArray, is_monotonic_increasing
@@ -69,6 +70,9 @@ class FixedMesh:
     _eos: AdamsWilliamsonEOS = field(init=False)
 
     def __post_init__(self):
+        # All geometric quantities derive from the radii, so ensuring the radii are contiguous
+        # float64 means the arrays used in the right-hand side operate on contiguous memory
+        self.radii = np.ascontiguousarray(self.radii, dtype=np.float64)
         if not is_monotonic_increasing(self.radii):
             msg: str = "Mesh must be monotonically increasing"
             logger.error(msg)
@@ -167,6 +171,11 @@ class Mesh:
         parameters: Parameters
     """
 
+    # The transform matrices only have two non-zero diagonals. Above this number of nodes they are
+    # stored as sparse matrices because the cost of the dense product grows quadratically, whereas
+    # for small meshes the dense product has less overhead.
+    _SPARSE_TRANSFORM_NUMBER_OF_NODES: int = 100
+
     def __init__(self, parameters: Parameters):
         self.settings: _MeshParameters = parameters.mesh
         basic_coordinates: np.ndarray = self.get_constant_spacing()
@@ -178,8 +187,11 @@ class Mesh:
             self.basic.outer_boundary,
             self.basic.inner_boundary,
         )
-        self._d_dr_transform: np.ndarray = self._get_d_dr_transform_matrix()
-        self._quantity_transform: np.ndarray = self._get_quantity_transform_matrix()
+        self._d_dr_transform: np.ndarray | csr_array = self._get_d_dr_transform_matrix()
+        self._quantity_transform: np.ndarray | csr_array = self._get_quantity_transform_matrix()
+        if self.basic.number_of_nodes > self._SPARSE_TRANSFORM_NUMBER_OF_NODES:
+            self._d_dr_transform = csr_array(self._d_dr_transform)
+            self._quantity_transform = csr_array(self._quantity_transform)
 
     def get_constant_spacing(self) -> np.ndarray:
         """Constant radius spacing across the mantle
@@ -194,6 +206,30 @@ class Mesh:
 
         return radii
 
+    @staticmethod
+    def _apply_transform(
+        transform: np.ndarray | csr_array, quantity: np.ndarray, out: np.ndarray | None
+    ) -> np.ndarray:
+        """Applies a transform matrix to a quantity.
+
+        Args:
+            transform: The transform matrix, either dense or sparse
+            quantity: The quantity to transform
+            out: Array to store the result, or None to allocate a new array
+
+        Returns:
+            The transformed quantity
+        """
+        if isinstance(transform, np.ndarray):
+            return transform.dot(quantity, out=out)
+
+        transformed: np.ndarray = transform @ quantity
+        if out is None:
+            return transformed
+        out[...] = transformed
+
+        return out
+
     def _get_d_dr_transform_matrix(self) -> np.ndarray:
         """Transform matrix for determining d/dr of a staggered quantity on the basic mesh.
 
@@ -211,16 +247,22 @@ class Mesh:
 
         return transform
 
-    def d_dr_at_basic_nodes(self, staggered_quantity: np.ndarray) -> np.ndarray:
+    def d_dr_at_basic_nodes(
+        self, staggered_quantity: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
         """Determines d/dr at the basic nodes of a quantity defined at the staggered nodes.
 
         Args:
             staggered_quantity: A quantity defined at the staggered nodes.
+            out: Array to store the result. Defaults to None, in which case a new array is
+                allocated.
 
         Returns:
             d/dr at the basic nodes
         """
-        d_dr_at_basic_nodes: np.ndarray = self._d_dr_transform.dot(staggered_quantity)
+        d_dr_at_basic_nodes: np.ndarray = self._apply_transform(
+            self._d_dr_transform, staggered_quantity, out
+        )
         logger.debug("d_dr_at_basic_nodes = %s", d_dr_at_basic_nodes)
 
         return d_dr_at_basic_nodes
@@ -254,7 +296,9 @@ class Mesh:
         return transform
 
     # TODO: Compatibility with conforming boundary/initial conditions?
-    def quantity_at_basic_nodes(self, staggered_quantity: np.ndarray) -> np.ndarray:
+    def quantity_at_basic_nodes(
+        self, staggered_quantity: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
         """Determines a quantity at the basic nodes that is defined at the staggered nodes.
 
         Uses backward and forward differences at the inner and outer radius, respectively, to
@@ -263,11 +307,15 @@ class Mesh:
 
         Args:
             staggered_quantity: A quantity defined at the staggered nodes
+            out: Array to store the result. Defaults to None, in which case a new array is
+                allocated.
 
         Returns:
             The quantity at the basic nodes
         """
-        quantity_at_basic_nodes: np.ndarray = self._quantity_transform.dot(staggered_quantity)
+        quantity_at_basic_nodes: np.ndarray = self._apply_transform(
+            self._quantity_transform, staggered_quantity, out
+        )
         logger.debug("quantity_at_basic_nodes = %s", quantity_at_basic_nodes)
 
         return quantity_at_basic_nodes
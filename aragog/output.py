@@ -21,7 +21,6 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
 import numpy as np
 from scipy.optimize import OptimizeResult
 
@@ -178,6 +177,9 @@ class Output:
         Args:
             num_lines: Number of lines to plot. Defaults to 11.
         """
+        # Deferred so that solving models does not incur the import cost of matplotlib
+        import matplotlib.pyplot as plt  # pylint: disable=C0415
+
         assert self.solution is not None
 
         self.state.update(self.solution.y, self.solution.t)
@@ -197,17 +199,27 @@ class Output:
         except AttributeError:
             pass
 
+        # Find the closest available time steps to the times of the intermediate lines, which
+        # are the same for every plot.
+        times: np.ndarray = self.times
+        desired_times: np.ndarray = times[0] + np.arange(1, num_lines - 1) * time_step
+        closest_time_indices: np.ndarray = np.clip(
+            np.searchsorted(times, desired_times), 1, times.size - 1
+        )
+        closer_to_previous: np.ndarray = (
+            desired_times - times[closest_time_indices - 1]
+            <= times[closest_time_indices] - desired_times
+        )
+        closest_time_indices[closer_to_previous] -= 1
+
         # Plot the first line.
         def plot_times(ax, x: np.ndarray, y: np.ndarray) -> None:
-            label_first: str = f"{self.times[0]:.2f}"
+            label_first: str = f"{times[0]:.2f}"
             ax.plot(x[:, 0], y, label=label_first)
 
             # Loop through the selected lines and plot each with a label.
-            for i in range(1, num_lines - 1):
-                desired_time: float = self.times[0] + i * time_step
-                # Find the closest available time step.
-                closest_time_index: np.intp = np.argmin(np.abs(self.times - desired_time))
-                time: float = self.times[closest_time_index]
+            for closest_time_index in closest_time_indices:
+                time: float = times[closest_time_index]
                 label: str = f"{time:.2f}"  # Create a label based on the time.
                 ax.plot(
                     x[:, closest_time_index],
@@ -216,7 +228,7 @@ class Output:
                 )
 
             # Plot the last line.
-            times_end: float = self.times[-1]
+            times_end: float = times[-1]
             label_last: str = f"{times_end:.2f}"
             ax.plot(x[:, -1], y, label=label_last)
 
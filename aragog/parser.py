@@ -18,24 +18,256 @@
 
 from __future__ import annotations
 
+import copy
 import logging
+import re
 import sys
-from dataclasses import Field, dataclass, field, fields
-from typing import Any
+import threading
+from contextlib import contextmanager
+from dataclasses import MISSING, dataclass, field, fields
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterator, Mapping
 
 import numpy as np
-from scipy import constants
-from thermochem import codata
-from typed_configparser import ConfigParser
 
 if sys.version_info < (3, 11):
     from typing_extensions import Self
 else:
     from typing import Self
 
+if TYPE_CHECKING:
+    from configparser import ConfigParser
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+# The constants are imported on first use to reduce the time to import the parser
+@cache
+def _get_stefan_boltzmann_constant() -> float:
+    """Stefan-Boltzmann constant with units of W/m^2/K^4"""
+    from thermochem import codata  # pylint: disable=C0415
+
+    return codata.value("Stefan-Boltzmann constant")
+
+
+@cache
+def _get_julian_year() -> float:
+    """Julian year in seconds"""
+    from scipy import constants  # pylint: disable=C0415
+
+    return constants.Julian_year
+
+
+_SECTION_RE: re.Pattern = re.compile(r"^\[([^\]]+)\][ \t]*$", re.M)
+_KEY_VALUE_RE: re.Pattern = re.compile(r"^([^=\s;#][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$", re.M)
+# Lines that are not blank, a comment, a section header, or an unindented key = value pair. For
+# example, continuation lines of multiline values, which are only understood by configparser.
+_UNSUPPORTED_LINE_RE: re.Pattern = re.compile(
+    r"^(?![ \t]*(?:[#;].*)?$|\[[^\]]+\][ \t]*$|[^=\s;#][^=\n]*=).+$", re.M
+)
+
+
+@cache
+def _get_boolean_states() -> Mapping[str, bool]:
+    """Strings that configparser accepts as booleans, so both parsers agree on their values"""
+    import configparser  # pylint: disable=C0415
+
+    return configparser.ConfigParser.BOOLEAN_STATES
+
+
+def _convert_to_bool(value: str) -> bool:
+    try:
+        return _get_boolean_states()[value.lower()]
+    except KeyError as exc:
+        raise ValueError(f"Cannot convert {value} to bool") from exc
+
+
+_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "bool": _convert_to_bool,
+    "float": float,
+    "int": int,
+    "str": str,
+}
+
+
+def _get_converter(field_type: str) -> Callable[[str], Any]:
+    """Converter for a field type, which tries each type of a union in turn
+
+    Args:
+        field_type: Type annotation of the field, for example float | str
+
+    Returns:
+        A function that converts a string value to the field type
+    """
+    converters: tuple[Callable[[str], Any], ...] = tuple(
+        _CONVERTERS[type_name.strip()] for type_name in field_type.split("|")
+    )
+    if len(converters) == 1:
+        return converters[0]
+
+    def convert(value: str) -> Any:
+        for converter in converters:
+            try:
+                return converter(value)
+            except ValueError:
+                continue
+
+        raise ValueError(f"Cannot convert {value} to {field_type}")
+
+    return convert
+
+
+@cache
+def _get_coercers(dataclass_: type) -> tuple[tuple[str, Callable[[str], Any], bool], ...]:
+    """Name, converter, and whether a value is required for each __init__ field of a dataclass
+
+    The table is built once for each dataclass so the fields are not introspected for every parse.
+    """
+    return tuple(
+        (
+            field_.name,
+            _get_converter(str(field_.type)),
+            field_.default is MISSING and field_.default_factory is MISSING,
+        )
+        for field_ in fields(dataclass_)
+        if field_.init
+    )
+
+
+def _build_dataclass(dataclass_: Any, section: Mapping[str, str], section_name: str) -> Any:
+    """Builds a dataclass from a section, converting values according to the field types.
+
+    Args:
+        dataclass_: Dataclass to instantiate
+        section: Options and values of the section
+        section_name: Name of the section
+
+    Returns:
+        An instance of the dataclass
+    """
+    kwargs: dict[str, Any] = {}
+    for name, converter, required in _get_coercers(dataclass_):
+        try:
+            value: str = section[name]
+        except KeyError as exc:
+            if required:
+                raise ValueError(f"{name} is missing from section {section_name}") from exc
+            continue
+        kwargs[name] = converter(value)
+
+    return dataclass_(**kwargs)
+
+
+@lru_cache(maxsize=16)
+def _read_config_text(path: Path, modification_time: int) -> str:
+    """Reads the configuration data in a file, which is cached until the file is modified
+
+    Args:
+        path: Path of the configuration data
+        modification_time: Modification time of the path, which is only used to invalidate the
+            cache
+
+    Returns:
+        The configuration data
+    """
+    del modification_time
+
+    return path.read_text(encoding="utf-8")
+
+
+class _UnsupportedConfigurationError(Exception):
+    """Configuration data that must be parsed by configparser"""
+
+
+class _FastConfigParser:
+    """Parses configuration data that only contains section headers and key = value pairs.
+
+    This avoids the overhead of configparser for the simple format of the configuration files, but
+    otherwise mirrors the parts of the configparser interface that are required to parse the
+    parameters. Configuration data that uses other features, such as a DEFAULT section, multiline
+    values, or interpolation, or that configparser rejects, such as duplicate sections or options,
+    raises _UnsupportedConfigurationError so that it is parsed by configparser instead.
+    """
+
+    def __init__(self):
+        self._sections: dict[str, dict[str, str]] = {}
+
+    def read_string(self, string: str) -> None:
+        """Parses configuration data from a string
+
+        Args:
+            string: Configuration data
+        """
+        if _UNSUPPORTED_LINE_RE.search(string):
+            raise _UnsupportedConfigurationError("Unsupported line in configuration data")
+        section_matches: list[re.Match] = list(_SECTION_RE.finditer(string))
+        ends: list[int] = [match.start() for match in section_matches[1:]] + [len(string)]
+        preamble_end: int = section_matches[0].start() if section_matches else len(string)
+        if _KEY_VALUE_RE.search(string, 0, preamble_end):
+            raise _UnsupportedConfigurationError("Option found before the first section header")
+        # Like configparser, sections and options may only be defined once in each source but a
+        # later source overrides the values of an earlier one
+        read_sections: set[str] = set()
+        for section_match, end in zip(section_matches, ends):
+            section_name: str = section_match.group(1)
+            if section_name == "DEFAULT":
+                raise _UnsupportedConfigurationError("DEFAULT section is not supported")
+            if section_name in read_sections:
+                raise _UnsupportedConfigurationError(f"Duplicate section {section_name}")
+            read_sections.add(section_name)
+            section: dict[str, str] = self._sections.setdefault(section_name, {})
+            read_options: set[str] = set()
+            for key_value in _KEY_VALUE_RE.finditer(string, section_match.end(), end):
+                option: str = key_value.group(1).lower()
+                value: str = key_value.group(2)
+                if option in read_options:
+                    raise _UnsupportedConfigurationError(f"Duplicate option {option}")
+                if ":" in option:
+                    raise _UnsupportedConfigurationError("Option with a : delimiter")
+                if "%" in value or "${" in value:
+                    raise _UnsupportedConfigurationError("Interpolation is not supported")
+                read_options.add(option)
+                section[option] = value
+
+    def sections(self) -> list[str]:
+        """Section names"""
+        return list(self._sections)
+
+    def __getitem__(self, section_name: str) -> dict[str, str]:
+        """Options and values of a section"""
+        return self._sections[section_name]
+
+
+# Constructing a ConfigParser is comparatively expensive, so fallback parsers are reused
+_CONFIG_PARSER_POOL: list[ConfigParser] = []
+_CONFIG_PARSER_POOL_LOCK: threading.Lock = threading.Lock()
+
+
+@contextmanager
+def _pooled_config_parser() -> Iterator[ConfigParser]:
+    """Borrows an empty ConfigParser from the pool
+
+    The parser is emptied and returned to the pool when the context exits.
+    """
+    with _CONFIG_PARSER_POOL_LOCK:
+        parser: ConfigParser | None = _CONFIG_PARSER_POOL.pop() if _CONFIG_PARSER_POOL else None
+    if parser is None:
+        # Imported on first use since configparser is only required by the fallback parser
+        import configparser  # pylint: disable=C0415
+
+        parser = configparser.ConfigParser()
+    try:
+        yield parser
+    finally:
+        # clear() does not empty DEFAULT so the sections and defaults are removed individually
+        for section in parser.sections():
+            parser.remove_section(section)
+        parser.defaults().clear()
+        with _CONFIG_PARSER_POOL_LOCK:
+            _CONFIG_PARSER_POOL.append(parser)
+
+
 def _get_dataclass_from_section_name() -> dict[str, Any]:
     """Maps the section names in the configuration data to the dataclasses that stores the data."""
     mapping: dict[str, Any] = {
@@ -54,7 +286,7 @@ def _get_dataclass_from_section_name() -> dict[str, Any]:
     return mapping
 
 
-@dataclass
+@dataclass(slots=True)
 class _ScalingsParameters:
     """Stores parameters in the scalings section in the configuration data. All units are SI.
 
@@ -85,6 +317,10 @@ class _ScalingsParameters:
         viscosity, Pa s
         time_years, years
         stefan_boltzmann_constant (non-dimensional)
+        inverse_density, inverse_gravitational_acceleration, inverse_heat_capacity,
+            inverse_heat_flux, inverse_latent_heat_per_mass, inverse_power_per_mass,
+            inverse_pressure, inverse_radius, inverse_temperature, inverse_time_years: Reciprocals
+            of the scalings, which scale parameters by multiplication rather than division
     """
 
     radius: float = 1
@@ -107,15 +343,25 @@ class _ScalingsParameters:
     viscosity: float = field(init=False)
     time_years: float = field(init=False)
     stefan_boltzmann_constant: float = field(init=False)
+    inverse_density: float = field(init=False, repr=False)
+    inverse_gravitational_acceleration: float = field(init=False, repr=False)
+    inverse_heat_capacity: float = field(init=False, repr=False)
+    inverse_heat_flux: float = field(init=False, repr=False)
+    inverse_latent_heat_per_mass: float = field(init=False, repr=False)
+    inverse_power_per_mass: float = field(init=False, repr=False)
+    inverse_pressure: float = field(init=False, repr=False)
+    inverse_radius: float = field(init=False, repr=False)
+    inverse_temperature: float = field(init=False, repr=False)
+    inverse_time_years: float = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self.area = np.square(self.radius)
-        self.gravitational_acceleration = self.radius / np.square(self.time)
+        self.area = self.radius * self.radius
+        self.gravitational_acceleration = self.radius / (self.time * self.time)
         self.temperature_gradient = self.temperature / self.radius
         self.thermal_expansivity = 1 / self.temperature
         self.pressure = self.density * self.gravitational_acceleration * self.radius
         self.velocity = self.radius / self.time
-        self.kinetic_energy_per_volume = self.density * np.square(self.velocity)
+        self.kinetic_energy_per_volume = self.density * (self.velocity * self.velocity)
         self.heat_capacity = self.kinetic_energy_per_volume / self.density / self.temperature
         self.latent_heat_per_mass = self.heat_capacity * self.temperature
         self.power_per_volume = self.kinetic_energy_per_volume / self.time
@@ -123,16 +369,28 @@ class _ScalingsParameters:
         self.heat_flux = self.power_per_volume * self.radius
         self.thermal_conductivity = self.power_per_volume * self.area / self.temperature
         self.viscosity = self.pressure * self.time
-        self.time_years = self.time / constants.Julian_year  # Equivalent to TIMEYRS C code
-        # Stefan-Boltzmann units for dimensional are W/m^2/K^4
-        self.stefan_boltzmann_constant: float = codata.value("Stefan-Boltzmann constant")
-        self.stefan_boltzmann_constant /= (
-            self.power_per_volume * self.radius / np.power(self.temperature, 4)
+        self.time_years = self.time / _get_julian_year()  # Equivalent to TIMEYRS C code
+        self.stefan_boltzmann_constant = _get_stefan_boltzmann_constant() / (
+            self.power_per_volume * self.radius / self.temperature**4
         )
-        logger.debug("scalings = %s", self)
+        self.inverse_density = 1 / self.density
+        self.inverse_gravitational_acceleration = 1 / self.gravitational_acceleration
+        self.inverse_heat_capacity = 1 / self.heat_capacity
+        self.inverse_heat_flux = 1 / self.heat_flux
+        self.inverse_latent_heat_per_mass = 1 / self.latent_heat_per_mass
+        self.inverse_power_per_mass = 1 / self.power_per_mass
+        self.inverse_pressure = 1 / self.pressure
+        self.inverse_radius = 1 / self.radius
+        self.inverse_temperature = 1 / self.temperature
+        self.inverse_time_years = 1 / self.time_years
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("scalings = %s", self)
+
 
+_BoundaryValueScaler = Callable[[float, _ScalingsParameters], float]
 
-@dataclass
+
+@dataclass(slots=True)
 class _BoundaryConditionsParameters:
     """Stores parameters in the boundary_conditions section in the configuration data."""
 
@@ -145,7 +403,19 @@ class _BoundaryConditionsParameters:
     core_radius: float
     core_density: float
     core_heat_capacity: float
-    scalings_: _ScalingsParameters = field(init=False)
+    # Scale the boundary value for each boundary condition
+    _INNER_BOUNDARY_VALUE_SCALERS: ClassVar[dict[int, _BoundaryValueScaler]] = {
+        1: lambda _value, _scalings: 0,
+        2: lambda value, scalings: value * scalings.inverse_heat_flux,
+        3: lambda value, scalings: value * scalings.inverse_temperature,
+    }
+    _OUTER_BOUNDARY_VALUE_SCALERS: ClassVar[dict[int, _BoundaryValueScaler]] = {
+        1: lambda value, _scalings: value,
+        2: lambda value, _scalings: value,
+        3: lambda value, _scalings: value,
+        4: lambda value, scalings: value * scalings.inverse_heat_flux,
+        5: lambda value, scalings: value * scalings.inverse_temperature,
+    }
 
     def scale_attributes(self, scalings: _ScalingsParameters) -> None:
         """Scales the attributes.
@@ -153,33 +423,34 @@ class _BoundaryConditionsParameters:
         Args:
             scalings: scalings
         """
-        self.scalings_ = scalings
-        self.equilibrium_temperature /= self.scalings_.temperature
-        self.core_radius /= self.scalings_.radius
-        self.core_density /= self.scalings_.density
-        self.core_heat_capacity /= self.scalings_.heat_capacity
-        self._scale_inner_boundary_condition()
-        self._scale_outer_boundary_condition()
-
-    def _scale_inner_boundary_condition(self) -> None:
+        self.equilibrium_temperature *= scalings.inverse_temperature
+        self.core_radius *= scalings.inverse_radius
+        self.core_density *= scalings.inverse_density
+        self.core_heat_capacity *= scalings.inverse_heat_capacity
+        self._scale_inner_boundary_condition(scalings)
+        self._scale_outer_boundary_condition(scalings)
+
+    def _scale_inner_boundary_condition(self, scalings: _ScalingsParameters) -> None:
         """Scales the inner boundary value.
 
         Equivalent to CORE_BC in C code.
             1: Simple core cooling
             2: Prescribed heat flux
             3: Prescribed temperature
+
+        Args:
+            scalings: scalings
         """
-        if self.inner_boundary_condition == 1:
-            self.inner_boundary_value = 0
-        elif self.inner_boundary_condition == 2:
-            self.inner_boundary_value /= self.scalings_.heat_flux
-        elif self.inner_boundary_condition == 3:
-            self.inner_boundary_value /= self.scalings_.temperature
-        else:
+        try:
+            scaler: _BoundaryValueScaler = self._INNER_BOUNDARY_VALUE_SCALERS[
+                self.inner_boundary_condition
+            ]
+        except KeyError as exc:
             msg: str = f"inner_boundary_condition = {self.inner_boundary_condition} is unknown"
-            raise ValueError(msg)
+            raise ValueError(msg) from exc
+        self.inner_boundary_value = scaler(self.inner_boundary_value, scalings)
 
-    def _scale_outer_boundary_condition(self) -> None:
+    def _scale_outer_boundary_condition(self, scalings: _ScalingsParameters) -> None:
         """Scales the outer boundary value.
 
         Equivalent to SURFACE_BC in C code.
@@ -188,23 +459,21 @@ class _BoundaryConditionsParameters:
             3: Couple to atmodeller
             4: Prescribed heat flux
             5: Prescribed temperature
+
+        Args:
+            scalings: scalings
         """
-        if self.outer_boundary_condition == 1:
-            pass
-        elif self.outer_boundary_condition == 2:
-            pass
-        elif self.outer_boundary_condition == 3:
-            pass
-        elif self.outer_boundary_condition == 4:
-            self.outer_boundary_value /= self.scalings_.heat_flux
-        elif self.outer_boundary_condition == 5:
-            self.outer_boundary_value /= self.scalings_.temperature
-        else:
+        try:
+            scaler: _BoundaryValueScaler = self._OUTER_BOUNDARY_VALUE_SCALERS[
+                self.outer_boundary_condition
+            ]
+        except KeyError as exc:
             msg: str = f"outer_boundary_condition = {self.outer_boundary_condition} is unknown"
-            raise ValueError(msg)
+            raise ValueError(msg) from exc
+        self.outer_boundary_value = scaler(self.outer_boundary_value, scalings)
 
 
-@dataclass
+@dataclass(slots=True)
 class _EnergyParameters:
     """Stores parameters in the energy section"""
 
@@ -216,13 +485,12 @@ class _EnergyParameters:
     tidal: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class _InitialConditionParameters:
     """Stores the settings in the initial_condition section in the configuration data."""
 
     surface_temperature: float
     basal_temperature: float
-    scalings_: _ScalingsParameters = field(init=False)
 
     def scale_attributes(self, scalings: _ScalingsParameters) -> None:
         """Scales the attributes.
@@ -230,12 +498,11 @@ class _InitialConditionParameters:
         Args:
             scalings: scalings
         """
-        self.scalings_ = scalings
-        self.surface_temperature /= self.scalings_.temperature
-        self.basal_temperature /= self.scalings_.temperature
+        self.surface_temperature *= scalings.inverse_temperature
+        self.basal_temperature *= scalings.inverse_temperature
 
 
-@dataclass
+@dataclass(slots=True)
 class _MeshParameters:
     """Stores parameters in the mesh section in the configuration data."""
 
@@ -247,7 +514,6 @@ class _MeshParameters:
     surface_density: float
     gravitational_acceleration: float
     adiabatic_bulk_modulus: float
-    scalings_: _ScalingsParameters = field(init=False)
 
     def scale_attributes(self, scalings: _ScalingsParameters) -> None:
         """Scales the attributes
@@ -255,15 +521,14 @@ class _MeshParameters:
         Args:
             scalings: scalings
         """
-        self.scalings_ = scalings
-        self.outer_radius /= self.scalings_.radius
-        self.inner_radius /= self.scalings_.radius
-        self.surface_density /= self.scalings_.density
-        self.gravitational_acceleration /= self.scalings_.gravitational_acceleration
-        self.adiabatic_bulk_modulus /= self.scalings_.pressure
+        self.outer_radius *= scalings.inverse_radius
+        self.inner_radius *= scalings.inverse_radius
+        self.surface_density *= scalings.inverse_density
+        self.gravitational_acceleration *= scalings.inverse_gravitational_acceleration
+        self.adiabatic_bulk_modulus *= scalings.inverse_pressure
 
 
-@dataclass
+@dataclass(slots=True)
 class _PhaseMixedParameters:
     """Stores settings in the phase_mixed section in the configuration data."""
 
@@ -275,7 +540,6 @@ class _PhaseMixedParameters:
     phase: str
     phase_transition_width: float
     grain_size: float
-    scalings_: _ScalingsParameters = field(init=False)
 
     def scale_attributes(self, scalings: _ScalingsParameters) -> None:
         """Scales the attributes
@@ -283,12 +547,11 @@ class _PhaseMixedParameters:
         Args:
             scalings: scalings
         """
-        self.scalings_ = scalings
-        self.latent_heat_of_fusion /= self.scalings_.latent_heat_per_mass
-        self.grain_size /= self.scalings_.radius
+        self.latent_heat_of_fusion *= scalings.inverse_latent_heat_per_mass
+        self.grain_size *= scalings.inverse_radius
 
 
-@dataclass
+@dataclass(slots=True)
 class _PhaseParameters:
     """Stores settings in a phase section in the configuration data.
 
@@ -301,7 +564,6 @@ class _PhaseParameters:
     thermal_conductivity: float | str
     thermal_expansivity: float | str
     viscosity: float | str
-    scalings_: _ScalingsParameters = field(init=False)
 
     def scale_attributes(self, scalings: _ScalingsParameters) -> None:
         """Scales the attributes if they are numbers.
@@ -309,31 +571,34 @@ class _PhaseParameters:
         Args:
             scalings: scalings
         """
-        self.scalings_ = scalings
-        cls_fields: tuple[Field, ...] = fields(self.__class__)
-        for field_ in cls_fields:
-            value: Any = getattr(self, field_.name)
-            try:
-                scaling: float = getattr(self.scalings_, field_.name)
-                scaled_value = value / scaling
-                setattr(self, field_.name, scaled_value)
+        for name in _PHASE_SCALED_FIELD_NAMES:
+            value: float | str = getattr(self, name)
+            if isinstance(value, (int, float)):
+                scaling: float = getattr(scalings, name)
+                scaled_value: float = value / scaling
+                setattr(self, name, scaled_value)
                 logger.info(
                     "%s is a number (value = %s, scaling = %s, scaled_value = %s)",
-                    field_.name,
+                    name,
                     value,
                     scaling,
                     scaled_value,
                 )
-            except AttributeError:
-                logger.info("No scaling found for %s", field_.name)
-            except TypeError:
+            else:
                 logger.info(
-                    "%s is a string (path to a filename) so the data will be scaled later",
-                    field_.name,
+                    "%s is a string (path to a filename) so the data will be scaled later", name
                 )
 
 
-@dataclass
+# Phase parameters that have a scaling, which excludes for example the melt fraction
+_PHASE_SCALED_FIELD_NAMES: tuple[str, ...] = tuple(
+    field_.name
+    for field_ in fields(_PhaseParameters)
+    if field_.name in {scalings_field.name for scalings_field in fields(_ScalingsParameters)}
+)
+
+
+@dataclass(slots=True)
 class _Radionuclide:
     """Stores the settings in a radionuclide section in the configuration data."""
 
@@ -343,7 +608,6 @@ class _Radionuclide:
     concentration: float
     heat_production: float
     half_life_years: float
-    scalings_: _ScalingsParameters = field(init=False)
 
     def scale_attributes(self, scalings: _ScalingsParameters) -> None:
         """Scales the attributes.
@@ -351,11 +615,10 @@ class _Radionuclide:
         Args:
             scalings: scalings
         """
-        self.scalings_ = scalings
-        self.t0_years /= self.scalings_.time_years
+        self.t0_years *= scalings.inverse_time_years
         self.concentration *= 1e-6  # to mass fraction
-        self.heat_production /= self.scalings_.power_per_mass
-        self.half_life_years /= self.scalings_.time_years
+        self.heat_production *= scalings.inverse_power_per_mass
+        self.half_life_years *= scalings.inverse_time_years
 
     def get_heating(self, time: np.ndarray | float) -> np.ndarray | float:
         """Radiogenic heating
@@ -375,23 +638,26 @@ class _Radionuclide:
         return heating
 
 
-@dataclass
+@dataclass(slots=True)
 class _SolverParameters:
-    """Stores settings in the solver section in the configuration data."""
+    """Stores settings in the solver section in the configuration data.
+
+    The integration method is any method accepted by scipy.integrate.solve_ivp and defaults to
+    BDF.
+    """
 
     start_time: float
     end_time: float
     atol: float
     rtol: float
-    scalings_: _ScalingsParameters = field(init=False)
+    method: str = "BDF"
 
     def scale_attributes(self, scalings: _ScalingsParameters) -> None:
-        self.scalings_ = scalings
-        self.start_time /= self.scalings_.time_years
-        self.end_time /= self.scalings_.time_years
+        self.start_time *= scalings.inverse_time_years
+        self.end_time *= scalings.inverse_time_years
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Parameters:
     """Assembles all the parameters.
 
@@ -399,6 +665,19 @@ class Parameters:
     (non-dimensionalised) consistently with each other.
     """
 
+    _RADIONUCLIDE_PREFIX: ClassVar[str] = "radionuclide_"
+    # Names of the fields to scale and whether the field is a list of dataclasses
+    _SCALE_PLAN: ClassVar[tuple[tuple[str, bool], ...]] = (
+        ("boundary_conditions", False),
+        ("initial_condition", False),
+        ("mesh", False),
+        ("phase_solid", False),
+        ("phase_liquid", False),
+        ("phase_mixed", False),
+        ("radionuclides", True),
+        ("solver", False),
+    )
+
     boundary_conditions: _BoundaryConditionsParameters
     energy: _EnergyParameters
     initial_condition: _InitialConditionParameters
@@ -411,52 +690,104 @@ class Parameters:
     solver: _SolverParameters
 
     def __post_init__(self):
-        cls_fields: tuple[Field, ...] = fields(self.__class__)
-        for field_ in cls_fields:
-            data = getattr(self, field_.name)
-            # Dataclass
-            if hasattr(data, "scale_attributes"):
-                data.scale_attributes(self.scalings)
-            # List of dataclasses
-            elif isinstance(data, list):
-                for entry in data:
-                    if hasattr(entry, "scale_attributes"):
-                        entry.scale_attributes(self.scalings)
+        for name, is_list in self._SCALE_PLAN:
+            if is_list:
+                for entry in getattr(self, name):
+                    entry.scale_attributes(self.scalings)
+            else:
+                getattr(self, name).scale_attributes(self.scalings)
 
     @classmethod
     def from_file(cls, *filenames) -> Self:
         """Parses the parameters in a configuration file(s)
 
+        Parsed parameters are cached according to the filenames and their modification times, so
+        parsing the same unchanged file(s) again returns a copy of the cached parameters.
+
         Args:
             *filenames: Filenames of the configuration data
         """
-        parser: ConfigParser = ConfigParser()
-        parser.read(*filenames)
+        paths: tuple[Path, ...] = tuple(Path(filename).resolve() for filename in filenames)
+        modification_times: tuple[int, ...] = tuple(path.stat().st_mtime_ns for path in paths)
+
+        return copy.deepcopy(cls._from_file_cached(paths, modification_times))
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _from_file_cached(
+        cls, paths: tuple[Path, ...], modification_times: tuple[int, ...]
+    ) -> Self:
+        """Parses the parameters in a configuration file(s)
+
+        Args:
+            paths: Paths of the configuration data
+            modification_times: Modification times of the paths, which are used to invalidate the
+                cache
+        """
+        texts: list[str] = [
+            _read_config_text(path, modification_time)
+            for path, modification_time in zip(paths, modification_times)
+        ]
+        parser: _FastConfigParser = _FastConfigParser()
+        try:
+            for text in texts:
+                parser.read_string(text)
+        except _UnsupportedConfigurationError as exc:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s so parsing with configparser", exc)
+            with _pooled_config_parser() as config_parser:
+                for path, text in zip(paths, texts):
+                    config_parser.read_string(text, source=str(path))
+                return cls._from_parser(config_parser)
+
+        return cls._from_parser(parser)
 
+    @classmethod
+    def _from_parser(cls, parser: _FastConfigParser | ConfigParser) -> Self:
+        """Creates the parameters from a parser that has read the configuration data
+
+        Args:
+            parser: Parser
+        """
         init_dict: dict[str, Any] = {}
         for section_name, dataclass_ in _get_dataclass_from_section_name().items():
-            init_dict[section_name] = parser.parse_section(
-                using_dataclass=dataclass_, section_name=section_name
-            )
-        radionuclides: list[_Radionuclide] = []
-        for radionuclide_section in cls.radionuclide_sections(parser):
-            radionuclide = parser.parse_section(
-                using_dataclass=_Radionuclide, section_name=radionuclide_section
-            )
-            radionuclides.append(radionuclide)
+            init_dict[section_name] = cls._parse_section(parser, dataclass_, section_name)
+        radionuclides: list[_Radionuclide] = [
+            cls._parse_section(parser, _Radionuclide, radionuclide_section)
+            for radionuclide_section in cls.radionuclide_sections(parser)
+        ]
 
         init_dict["radionuclides"] = radionuclides
 
         return cls(**init_dict)  # Unpacking gives required arguments so pylint: disable=E1125
 
     @staticmethod
-    def radionuclide_sections(parser: ConfigParser) -> list[str]:
+    def _parse_section(
+        parser: _FastConfigParser | ConfigParser, dataclass_: Any, section_name: str
+    ) -> Any:
+        """Parses a section into a dataclass
+
+        Args:
+            parser: Parser that has read the configuration data
+            dataclass_: Dataclass to instantiate
+            section_name: Name of the section
+
+        Returns:
+            An instance of the dataclass
+        """
+        try:
+            section: Mapping[str, str] = parser[section_name]
+        except KeyError as exc:
+            raise ValueError(f"Section {section_name} is missing") from exc
+
+        return _build_dataclass(dataclass_, section, section_name)
+
+    @classmethod
+    def radionuclide_sections(cls, parser: _FastConfigParser | ConfigParser) -> list[str]:
         """Section names relating to radionuclides
 
         Sections relating to radionuclides must have the prefix radionuclide_
         """
-        return [
-            parser[section].name
-            for section in parser.sections()
-            if section.startswith("radionuclide_")
-        ]
+        prefix: str = cls._RADIONUCLIDE_PREFIX
+
+        return [section for section in parser.sections() if section.startswith(prefix)]
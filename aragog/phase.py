@@ -31,7 +31,12 @@ from aragog.interfaces import (
     PhaseEvaluatorProtocol,
     PropertyProtocol,
 )
-from aragog.parser import Parameters, _PhaseMixedParameters, _PhaseParameters
+from aragog.parser import (
+    Parameters,
+    _PhaseMixedParameters,
+    _PhaseParameters,
+    _ScalingsParameters,
+)
 from aragog.utilities import (
     FloatOrArray,
     combine_properties,
@@ -47,6 +52,8 @@ else:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_PHASE_PARAMETERS_FIELDS: tuple[Field, ...] = fields(_PhaseParameters)
+
 
 @dataclass
 class ConstantProperty(PropertyProtocol):
@@ -166,6 +173,7 @@ class SinglePhaseEvaluator(PhaseEvaluatorABC):
     Args:
         settings: Phase parameters
         gravitational_acceleration: Gravitational acceleration
+        scalings: Scalings, which scale the lookup data
     """
 
     # For typing
@@ -177,10 +185,14 @@ class SinglePhaseEvaluator(PhaseEvaluatorABC):
     _thermal_expansivity: PropertyProtocol
     _viscosity: PropertyProtocol
 
-    def __init__(self, settings: _PhaseParameters, gravitational_acceleration: float):
+    def __init__(
+        self,
+        settings: _PhaseParameters,
+        gravitational_acceleration: float,
+        scalings: _ScalingsParameters,
+    ):
         self._settings: _PhaseParameters = settings
-        cls_fields: tuple[Field, ...] = fields(self._settings)
-        for field_ in cls_fields:
+        for field_ in _PHASE_PARAMETERS_FIELDS:
             name: str = field_.name
             private_name: str = f"_{name}"
             value = getattr(self._settings, field_.name)
@@ -199,7 +211,7 @@ class SinglePhaseEvaluator(PhaseEvaluatorABC):
                 # Scale lookup data
                 for nn, col_name in enumerate(col_names):
                     logger.info("Scaling %s from %s", col_name, value)
-                    value_array[:, nn] /= getattr(self._settings.scalings_, col_name)
+                    value_array[:, nn] /= getattr(scalings, col_name)
                 logger.debug("after scaling, value_array = %s", value_array)
                 ndim = value_array.shape[1]
                 logger.debug("ndim = %d", ndim)
@@ -260,11 +272,12 @@ class MixedPhaseEvaluator(PhaseEvaluatorABC):
 
     def __init__(self, parameters: Parameters):
         self.settings: _PhaseMixedParameters = parameters.phase_mixed
+        self._scalings: _ScalingsParameters = parameters.scalings
         self._liquid: PhaseEvaluatorProtocol = SinglePhaseEvaluator(
-            parameters.phase_liquid, parameters.mesh.gravitational_acceleration
+            parameters.phase_liquid, parameters.mesh.gravitational_acceleration, self._scalings
         )
         self._solid: PhaseEvaluatorProtocol = SinglePhaseEvaluator(
-            parameters.phase_solid, parameters.mesh.gravitational_acceleration
+            parameters.phase_solid, parameters.mesh.gravitational_acceleration, self._scalings
         )
         self._solidus: LookupProperty1D = self._get_melting_curve_lookup(
             "solidus", self.settings.solidus
@@ -405,7 +418,7 @@ class MixedPhaseEvaluator(PhaseEvaluatorABC):
         logger.debug("before scaling, value_array = %s", value_array)
         for nn, col_name in enumerate(col_names):
             logger.info("Scaling %s from %s", col_name, value)
-            value_array[:, nn] /= getattr(self.settings.scalings_, col_name)
+            value_array[:, nn] /= getattr(self._scalings, col_name)
 
         return LookupProperty1D(name=name, value=value_array)
 
@@ -423,10 +436,14 @@ class CompositePhaseEvaluator(PhaseEvaluatorABC):
 
     def __init__(self, parameters: Parameters):
         self._liquid: PhaseEvaluatorProtocol = SinglePhaseEvaluator(
-            parameters.phase_liquid, parameters.mesh.gravitational_acceleration
+            parameters.phase_liquid,
+            parameters.mesh.gravitational_acceleration,
+            parameters.scalings,
         )
         self._solid: PhaseEvaluatorProtocol = SinglePhaseEvaluator(
-            parameters.phase_solid, parameters.mesh.gravitational_acceleration
+            parameters.phase_solid,
+            parameters.mesh.gravitational_acceleration,
+            parameters.scalings,
         )
         self._mixed: MixedPhaseEvaluator = MixedPhaseEvaluator(parameters)
 
@@ -554,11 +571,14 @@ class CompositePhaseEvaluator(PhaseEvaluatorABC):
         """Evaluates the composite property"""
         mixed_phase: np.ndarray = getattr(self._mixed, property_name)()
         single_phase: np.ndarray = np.empty_like(self._blending_factor)
-        logger.debug("single_phase = %s", single_phase)
-        logger.debug("_liquid_mask = %s", self._liquid_mask)
-        logger.debug("_solid_mask = %s", self._solid_mask)
-        test = getattr(self._liquid, property_name)()
-        logger.debug("test = %s", test)
+        # Guarded because this is called for every property in every right-hand side evaluation
+        # and the liquid property would otherwise be evaluated only to be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("single_phase = %s", single_phase)
+            logger.debug("_liquid_mask = %s", self._liquid_mask)
+            logger.debug("_solid_mask = %s", self._solid_mask)
+            test = getattr(self._liquid, property_name)()
+            logger.debug("test = %s", test)
 
         # logger.debug(self.temperature.shape)
         # logger.debug(self.pressure.shape)
@@ -610,8 +630,13 @@ class PhaseEvaluatorCollection:
 
     def __post_init__(self, parameters: Parameters):
         gravitation_acceleration: float = parameters.mesh.gravitational_acceleration
-        self.liquid = SinglePhaseEvaluator(parameters.phase_liquid, gravitation_acceleration)
-        self.solid = SinglePhaseEvaluator(parameters.phase_solid, gravitation_acceleration)
+        scalings: _ScalingsParameters = parameters.scalings
+        self.liquid = SinglePhaseEvaluator(
+            parameters.phase_liquid, gravitation_acceleration, scalings
+        )
+        self.solid = SinglePhaseEvaluator(
+            parameters.phase_solid, gravitation_acceleration, scalings
+        )
         self.mixed = MixedPhaseEvaluator(parameters)
         self.composite = CompositePhaseEvaluator(parameters)
 
@@ -22,22 +22,76 @@ import copy
 import logging
 from dataclasses import InitVar, dataclass, field
 from pathlib import Path
+from typing import Any, ClassVar
 
 import numpy as np
 from scipy.integrate import solve_ivp
 from scipy.optimize import OptimizeResult
+from scipy.sparse import diags_array
 
 from aragog.core import BoundaryConditions, InitialCondition
 from aragog.interfaces import PhaseEvaluatorProtocol
 from aragog.mesh import Mesh
 from aragog.parser import Parameters, _EnergyParameters, _Radionuclide
 from aragog.phase import PhaseEvaluatorCollection
-from aragog.utilities import FloatOrArray
+from aragog.utilities import ArrayBuffers, FloatOrArray
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
+class _PhaseProperties:
+    """Phase properties that are evaluated together, once for each update of the state.
+
+    Args:
+        density: Density
+        dTdrs: Adiabatic temperature gradient
+        gravitational_acceleration: Gravitational acceleration
+        heat_capacity: Heat capacity
+        thermal_conductivity: Thermal conductivity
+        thermal_expansivity: Thermal expansivity
+    """
+
+    density: FloatOrArray
+    dTdrs: np.ndarray
+    gravitational_acceleration: FloatOrArray
+    heat_capacity: FloatOrArray
+    thermal_conductivity: FloatOrArray
+    thermal_expansivity: FloatOrArray
+
+    @classmethod
+    def from_evaluator(
+        cls, evaluator: PhaseEvaluatorProtocol, temperature: np.ndarray
+    ) -> _PhaseProperties:
+        """Evaluates the properties of a phase evaluator at its current temperature and pressure
+
+        The adiabatic temperature gradient is derived from the evaluated properties, using the same
+        expression as PhaseEvaluatorABC.dTdrs, rather than by the evaluator which would evaluate
+        the properties again.
+
+        Args:
+            evaluator: Phase evaluator
+            temperature: Temperature at which the evaluator was updated
+
+        Returns:
+            The phase properties
+        """
+        density: FloatOrArray = evaluator.density()
+        gravitational_acceleration: FloatOrArray = evaluator.gravitational_acceleration()
+        heat_capacity: FloatOrArray = evaluator.heat_capacity()
+        thermal_expansivity: FloatOrArray = evaluator.thermal_expansivity()
+
+        return cls(
+            density=density,
+            dTdrs=-gravitational_acceleration * thermal_expansivity * temperature / heat_capacity,
+            gravitational_acceleration=gravitational_acceleration,
+            heat_capacity=heat_capacity,
+            thermal_conductivity=evaluator.thermal_conductivity(),
+            thermal_expansivity=thermal_expansivity,
+        )
+
+
+@dataclass(slots=True)
 class State:
     """Stores and updates the state at temperature and pressure.
 
@@ -64,11 +118,14 @@ class State:
         viscous_velocity: Viscous velocity at the basic nodes
     """
 
+    # Critical Reynolds number from Abe (1993)
+    critical_reynolds_number: ClassVar[float] = 9 / 8
     parameters: InitVar[Parameters]
     _evaluator: Evaluator
     _settings: _EnergyParameters = field(init=False)
     phase_basic: PhaseEvaluatorProtocol = field(init=False)
     phase_staggered: PhaseEvaluatorProtocol = field(init=False)
+    _phase_basic_properties: _PhaseProperties = field(init=False)
     _dTdr: np.ndarray = field(init=False)
     _eddy_diffusivity: np.ndarray = field(init=False)
     _heat_flux: np.ndarray = field(init=False)
@@ -80,6 +137,13 @@ class State:
     _temperature_staggered: np.ndarray = field(init=False)
     _viscous_velocity: np.ndarray = field(init=False)
     _inviscid_velocity: np.ndarray = field(init=False)
+    _viscous_mixing_length_factor: np.ndarray = field(init=False)
+    _inviscid_mixing_length_factor: np.ndarray = field(init=False)
+    _radionuclide_heat_production: np.ndarray = field(init=False)
+    _radionuclide_half_life_years: np.ndarray = field(init=False)
+    _radionuclide_t0_years: np.ndarray = field(init=False)
+    _capacitance_staggered: FloatOrArray = field(init=False)
+    _buffers: ArrayBuffers = field(init=False, default_factory=ArrayBuffers)
 
     def __post_init__(self, parameters: Parameters):
         self._settings = parameters.energy
@@ -89,27 +153,48 @@ class State:
         self.phase_basic.set_pressure(self._evaluator.mesh.basic.pressure)
         self.phase_staggered = copy.deepcopy(self._evaluator.phases.active)
         self.phase_staggered.set_pressure(self._evaluator.mesh.staggered.pressure)
+        # The mixing length is fixed so the constant factors of the velocities are precomputed
+        self._viscous_mixing_length_factor = self._evaluator.mesh.basic.mixing_length_cubed / 18
+        self._inviscid_mixing_length_factor = self._evaluator.mesh.basic.mixing_length_squared / 16
+        # Radionuclide data are stacked as column vectors so that the heating of all the
+        # radionuclides is evaluated together
+        radionuclides: list[_Radionuclide] = self._evaluator.radionuclides
+        self._radionuclide_heat_production = np.array(
+            [
+                radionuclide.heat_production * radionuclide.abundance * radionuclide.concentration
+                for radionuclide in radionuclides
+            ],
+            dtype=np.float64,
+        )[:, np.newaxis]
+        self._radionuclide_half_life_years = np.array(
+            [radionuclide.half_life_years for radionuclide in radionuclides], dtype=np.float64
+        )[:, np.newaxis]
+        self._radionuclide_t0_years = np.array(
+            [radionuclide.t0_years for radionuclide in radionuclides], dtype=np.float64
+        )[:, np.newaxis]
 
     def capacitance_staggered(self) -> FloatOrArray:
-        capacitance: FloatOrArray = (
-            self.phase_staggered.density() * self.phase_staggered.heat_capacity()
-        )
+        return self._capacitance_staggered
 
-        return capacitance
-
-    def conductive_heat_flux(self) -> np.ndarray:
+    def conductive_heat_flux(self, out: np.ndarray | None = None) -> np.ndarray:
         r"""Conductive heat flux:
 
         .. math::
             J_{cond} = -k \frac{\partial T}{\partial r}
 
         where :math:`k` is thermal conductivity, :math:`T` is temperature, and :math:`r` is radius.
+
+        Args:
+            out: Array to store the result. Defaults to None, in which case a new array is
+                allocated.
         """
-        conductive_heat_flux: np.ndarray = self.phase_basic.thermal_conductivity() * -self.dTdr()
+        conductive_heat_flux: np.ndarray = np.multiply(
+            self._phase_basic_properties.thermal_conductivity, self.dTdr(), out=out
+        )
 
-        return conductive_heat_flux
+        return np.negative(conductive_heat_flux, out=conductive_heat_flux)
 
-    def convective_heat_flux(self) -> np.ndarray:
+    def convective_heat_flux(self, out: np.ndarray | None = None) -> np.ndarray:
         r"""Convective heat flux:
 
         .. math::
@@ -118,15 +203,29 @@ class State:
         where :math:`\rho` is density, :math:`c_p` is heat capacity at constant pressure,
         :math:`\kappa_h` is eddy diffusivity, :math:`T` is temperature, :math:`r` is radius, and
         :math:`S` is entropy.
+
+        Args:
+            out: Array to store the result. Defaults to None, in which case a new array is
+                allocated.
         """
-        convective_heat_flux: np.ndarray = (
-            self.phase_basic.density()
-            * self.phase_basic.heat_capacity()
-            * self.eddy_diffusivity()
-            * -self._super_adiabatic_temperature_gradient
+        # Allocated up front because the product of constant properties is not an array
+        if out is None:
+            out = np.empty_like(self._eddy_diffusivity)
+        convective_heat_flux: np.ndarray = np.multiply(
+            self._phase_basic_properties.density,
+            self._phase_basic_properties.heat_capacity,
+            out=out,
+        )
+        convective_heat_flux = np.multiply(
+            convective_heat_flux, self.eddy_diffusivity(), out=convective_heat_flux
+        )
+        convective_heat_flux = np.multiply(
+            convective_heat_flux,
+            self._super_adiabatic_temperature_gradient,
+            out=convective_heat_flux,
         )
 
-        return convective_heat_flux
+        return np.negative(convective_heat_flux, out=convective_heat_flux)
 
     def radiogenic_heating(self, time: FloatOrArray) -> FloatOrArray:
         """Radiogenic heating
@@ -138,9 +237,13 @@ class State:
             Radiogenic heating as a single column (in a 2-D array) if time is a float, otherwise a
                 2-D array with each column associated with a single time in the time array.
         """
-        radiogenic_heating_float: FloatOrArray = 0
-        for radionuclide in self._evaluator.radionuclides:
-            radiogenic_heating_float += radionuclide.get_heating(time)
+        # Equivalent to summing _Radionuclide.get_heating over the radionuclides
+        arg: np.ndarray = (
+            np.log(2) * (self._radionuclide_t0_years - time) / self._radionuclide_half_life_years
+        )
+        radiogenic_heating_float: np.ndarray = np.sum(
+            self._radionuclide_heat_production * np.exp(arg), axis=0
+        )
 
         radiogenic_heating: FloatOrArray = radiogenic_heating_float * (
             self.phase_staggered.density() / self.capacitance_staggered()
@@ -148,11 +251,6 @@ class State:
 
         return radiogenic_heating
 
-    @property
-    def critical_reynolds_number(self) -> float:
-        """Critical Reynolds number from Abe (1993)"""
-        return 9 / 8
-
     def dTdr(self) -> np.ndarray:
         return self._dTdr
 
@@ -229,6 +327,64 @@ class State:
     def viscous_velocity(self) -> np.ndarray:
         return self._viscous_velocity
 
+    def _update_convective_velocities(self, basic_shape: tuple[int, ...]) -> None:
+        """Updates the velocities, Reynolds number, and eddy diffusivity of the convective flow.
+
+        Args:
+            basic_shape: Shape of the arrays at the basic nodes
+        """
+        self._viscous_velocity = self._buffers.get("viscous_velocity", basic_shape)
+        self._inviscid_velocity = self._buffers.get("inviscid_velocity", basic_shape)
+        self._reynolds_number = self._buffers.get("reynolds_number", basic_shape)
+        self._eddy_diffusivity = self._buffers.get("eddy_diffusivity", basic_shape)
+        # Without super-adiabatic nodes there is no convection, so the velocity calculations are
+        # skipped, which is often the case as the interior cools
+        if not self._is_convective.any():
+            self._viscous_velocity.fill(0)
+            self._inviscid_velocity.fill(0)
+            self._reynolds_number.fill(0)
+            self._eddy_diffusivity.fill(0)
+            return
+
+        # Same as PhaseEvaluatorABC.kinematic_viscosity but reuses the evaluated density
+        kinematic_viscosity: FloatOrArray = (
+            self.phase_basic.viscosity() / self._phase_basic_properties.density
+        )
+        mixing_length: np.ndarray = self._evaluator.mesh.basic.mixing_length
+        # Zeroing the velocity prefactor where the flow is not super-adiabatic also zeroes the
+        # velocities, so they are computed in place without any further masking. Multiplying by
+        # the mask avoids the gather and scatter of boolean indexing.
+        velocity_prefactor: np.ndarray = np.multiply(
+            self._phase_basic_properties.gravitational_acceleration,
+            self._phase_basic_properties.thermal_expansivity,
+            out=self._buffers.get("velocity_prefactor", basic_shape),
+        )
+        velocity_prefactor *= self._super_adiabatic_temperature_gradient
+        np.negative(velocity_prefactor, out=velocity_prefactor)
+        velocity_prefactor *= self._is_convective
+        # Viscous velocity
+        np.multiply(
+            velocity_prefactor, self._viscous_mixing_length_factor, out=self._viscous_velocity
+        )
+        self._viscous_velocity /= kinematic_viscosity
+        # Inviscid velocity
+        np.multiply(
+            velocity_prefactor, self._inviscid_mixing_length_factor, out=self._inviscid_velocity
+        )
+        np.sqrt(self._inviscid_velocity, out=self._inviscid_velocity)
+        # Reynolds number
+        np.multiply(self._viscous_velocity, mixing_length, out=self._reynolds_number)
+        self._reynolds_number /= kinematic_viscosity
+        # Eddy diffusivity
+        viscous_regime: np.ndarray = np.less_equal(
+            self._reynolds_number,
+            self.critical_reynolds_number,
+            out=self._buffers.get("viscous_regime", basic_shape, bool),
+        )
+        np.copyto(self._eddy_diffusivity, self._inviscid_velocity)
+        np.copyto(self._eddy_diffusivity, self._viscous_velocity, where=viscous_regime)
+        self._eddy_diffusivity *= mixing_length
+
     def update(self, temperature: np.ndarray, time: FloatOrArray) -> None:
         """Updates the state.
 
@@ -242,63 +398,62 @@ class State:
         logger.debug("Updating the state")
 
         logger.debug("Setting the temperature profile")
+        # Local reference to avoid repeated attribute lookups for every right-hand side evaluation
+        mesh: Mesh = self._evaluator.mesh
+        basic_shape: tuple[int, ...] = (mesh.basic.number_of_nodes, *temperature.shape[1:])
         self._temperature_staggered = temperature
-        self._temperature_basic = self._evaluator.mesh.quantity_at_basic_nodes(temperature)
-        logger.debug("temperature_basic = %s", self.temperature_basic)
-        self._dTdr = self._evaluator.mesh.d_dr_at_basic_nodes(temperature)
-        logger.debug("dTdr = %s", self.dTdr())
+        self._temperature_basic = mesh.quantity_at_basic_nodes(
+            temperature, out=self._buffers.get("temperature_basic", basic_shape)
+        )
+        logger.debug("temperature_basic = %s", self._temperature_basic)
+        self._dTdr = mesh.d_dr_at_basic_nodes(
+            temperature, out=self._buffers.get("dTdr", basic_shape)
+        )
+        logger.debug("dTdr = %s", self._dTdr)
         self._evaluator.boundary_conditions.conform_temperature_boundary_conditions(
-            temperature, self._temperature_basic, self.dTdr()
+            temperature, self._temperature_basic, self._dTdr
         )
 
         self.phase_staggered.set_temperature(temperature)
         self.phase_staggered.update()
+        # Used by both the radiogenic heating and dT/dt so it is only evaluated once per update
+        self._capacitance_staggered = (
+            self.phase_staggered.density() * self.phase_staggered.heat_capacity()
+        )
         self.phase_basic.set_temperature(self._temperature_basic)
         self.phase_basic.update()
-
-        self._super_adiabatic_temperature_gradient = self.dTdr() - self.phase_basic.dTdrs()
-        self._is_convective = self._super_adiabatic_temperature_gradient < 0
-        velocity_prefactor: np.ndarray = (
-            self.phase_basic.gravitational_acceleration()
-            * self.phase_basic.thermal_expansivity()
-            * -self._super_adiabatic_temperature_gradient
+        self._phase_basic_properties = _PhaseProperties.from_evaluator(
+            self.phase_basic, self._temperature_basic
         )
-        # Viscous velocity
-        self._viscous_velocity = (
-            velocity_prefactor * self._evaluator.mesh.basic.mixing_length_cubed
-        ) / (18 * self.phase_basic.kinematic_viscosity())
-        self._viscous_velocity[~self.is_convective] = 0  # Must be super-adiabatic
-        # Inviscid velocity
-        self._inviscid_velocity = (
-            velocity_prefactor * self._evaluator.mesh.basic.mixing_length_squared
-        ) / 16
-        self._inviscid_velocity[~self.is_convective] = 0  # Must be super-adiabatic
-        self._inviscid_velocity[self._is_convective] = np.sqrt(
-            self._inviscid_velocity[self._is_convective]
-        )
-        # Reynolds number
-        self._reynolds_number = (
-            self._viscous_velocity
-            * self._evaluator.mesh.basic.mixing_length
-            / self.phase_basic.kinematic_viscosity()
+
+        self._super_adiabatic_temperature_gradient = np.subtract(
+            self.dTdr(),
+            self._phase_basic_properties.dTdrs,
+            out=self._buffers.get("super_adiabatic_temperature_gradient", basic_shape),
         )
-        # Eddy diffusivity
-        self._eddy_diffusivity = np.where(
-            self.viscous_regime, self._viscous_velocity, self._inviscid_velocity
+        self._is_convective = np.less(
+            self._super_adiabatic_temperature_gradient,
+            0,
+            out=self._buffers.get("is_convective", basic_shape, bool),
         )
-        self._eddy_diffusivity *= self._evaluator.mesh.basic.mixing_length
+        self._update_convective_velocities(basic_shape)
         # Heat flux
-        self._heat_flux = np.zeros_like(self.temperature_basic)
+        self._heat_flux = self._buffers.get("heat_flux", basic_shape)
         if self._settings.conduction:
-            self._heat_flux += self.conductive_heat_flux()
+            self.conductive_heat_flux(out=self._heat_flux)
+        else:
+            self._heat_flux.fill(0)
         if self._settings.convection:
-            self._heat_flux += self.convective_heat_flux()
+            self._heat_flux += self.convective_heat_flux(
+                out=self._buffers.get("convective_heat_flux", basic_shape)
+            )
         if self._settings.gravitational_separation:
             self._heat_flux += self.gravitational_separation_flux
         if self._settings.mixing:
             self._heat_flux += self.mixing_flux
         # Heating
-        self._heating = np.zeros_like(self.temperature_staggered)
+        self._heating = self._buffers.get("heating", temperature.shape)
+        self._heating.fill(0)
         if self._settings.radionuclides:
             self._heating += self.radiogenic_heating(time)
 
@@ -350,6 +505,11 @@ class Solver:
         state: State
     """
 
+    __slots__ = ("filename", "root", "parameters", "evaluator", "state", "_solution", "_buffers")
+
+    # Implicit methods of solve_ivp that accept the sparsity structure of the Jacobian
+    _SPARSE_JACOBIAN_METHODS: tuple[str, ...] = ("BDF", "Radau")
+
     def __init__(self, filename: str | Path, root: str | Path = Path()):
         logger.info("Creating an Aragog model")
         self.filename = Path(filename)
@@ -358,6 +518,7 @@ class Solver:
         self.evaluator: Evaluator
         self.state: State
         self._solution: OptimizeResult
+        self._buffers: ArrayBuffers = ArrayBuffers()
         self.parse_configuration()
 
     def parse_configuration(self) -> None:
@@ -396,37 +557,56 @@ class Solver:
     ) -> np.ndarray:
         """dT/dt at the staggered nodes
 
+        The temperature is always a 2-D array since solve_ivp is called with vectorized=True.
+        Each column is an independent state, e.g. for the finite difference approximation of the
+        Jacobian, and all the columns are evaluated together without reshaping.
+
         Args:
             time: Time
-            temperature: Temperature at the staggered nodes
+            temperature: Temperature at the staggered nodes with one column per state
 
         Returns:
-            dT/dt at the staggered nodes
+            dT/dt at the staggered nodes with the same shape as temperature
         """
         logger.debug("temperature passed into dTdt = %s", temperature)
         # logger.debug("temperature.shape = %s", temperature.shape)
-        self.state.update(temperature, time)
-        heat_flux: np.ndarray = self.state.heat_flux
+        # Local references to avoid repeated attribute lookups for every evaluation
+        state: State = self.state
+        mesh: Mesh = self.evaluator.mesh
+        state.update(temperature, time)
+        heat_flux: np.ndarray = state.heat_flux
         # logger.debug("heat_flux = %s", heat_flux)
-        self.evaluator.boundary_conditions.apply(self.state)
+        self.evaluator.boundary_conditions.apply(state)
         # logger.debug("heat_flux = %s", heat_flux)
         # logger.debug("mesh.basic.area.shape = %s", self.data.mesh.basic.area.shape)
 
-        energy_flux: np.ndarray = heat_flux * self.evaluator.mesh.basic.area
+        energy_flux: np.ndarray = np.multiply(
+            heat_flux,
+            mesh.basic.area,
+            out=self._buffers.get("energy_flux", heat_flux.shape),
+        )
         # logger.debug("energy_flux size = %s", energy_flux.shape)
 
-        delta_energy_flux: np.ndarray = np.diff(energy_flux, axis=0)
+        delta_energy_flux: np.ndarray = np.subtract(
+            energy_flux[1:],
+            energy_flux[:-1],
+            out=self._buffers.get("delta_energy_flux", temperature.shape),
+        )
         # logger.debug("delta_energy_flux size = %s", delta_energy_flux.shape)
         # logger.debug("capacitance = %s", self.state.phase_staggered.capacitance.shape)
         # FIXME: Update capacitance for mixed phase (enthalpy of fusion contribution)
-        capacitance: np.ndarray = (
-            self.state.capacitance_staggered() * self.evaluator.mesh.basic.volume
+        capacitance: np.ndarray = np.multiply(
+            state.capacitance_staggered(),
+            mesh.basic.volume,
+            out=self._buffers.get("capacitance", temperature.shape),
         )
 
-        dTdt: np.ndarray = -delta_energy_flux / capacitance
+        # Not a buffer because solve_ivp keeps references to (views of) the returned array
+        dTdt: np.ndarray = np.divide(delta_energy_flux, capacitance)
+        np.negative(dTdt, out=dTdt)
         logger.debug("dTdt (fluxes only) = %s", dTdt)
 
-        dTdt += self.state.heating
+        dTdt += state.heating
         logger.debug("dTdt (with internal heating) = %s", dTdt)
 
         return dTdt
@@ -440,15 +620,32 @@ class Solver:
         logger.debug("end_time = %f", end_time)
         atol: float = self.parameters.solver.atol
         rtol: float = self.parameters.solver.rtol
+        method: str = self.parameters.solver.method
+        logger.debug("method = %s", method)
+        options: dict[str, Any] = {}
+        # dT/dt at a staggered node only depends on the temperature at the node and its
+        # neighbours, so the Jacobian is tridiagonal
+        if method in self._SPARSE_JACOBIAN_METHODS:
+            number_of_nodes: int = self.evaluator.mesh.staggered.number_of_nodes
+            options["jac_sparsity"] = diags_array(
+                [1, 1, 1],
+                offsets=[-1, 0, 1],
+                shape=(number_of_nodes, number_of_nodes),
+                dtype=bool,
+            )
+        elif method == "LSODA":
+            options["lband"] = 1
+            options["uband"] = 1
 
         self._solution = solve_ivp(
             self.dTdt,
             (start_time, end_time),
             self.evaluator.initial_condition.temperature,
-            method="BDF",
+            method=method,
             vectorized=True,
             atol=atol,
             rtol=rtol,
+            **options,
         )
 
         logger.info(self.solution)
@@ -32,6 +32,37 @@ MultiplyT = TypeVar("MultiplyT", float, np.ndarray, pd.Series, pd.DataFrame)
 FloatOrArray = float | np.ndarray
 
 
+class ArrayBuffers:
+    """Preallocated arrays that are reused by repeated evaluations with the same shape.
+
+    The solver evaluates the right-hand side thousands of times, so reusing the arrays avoids
+    allocating them for each evaluation.
+    """
+
+    def __init__(self):
+        self._arrays: dict[tuple[str, tuple[int, ...]], np.ndarray] = {}
+
+    def get(self, name: str, shape: tuple[int, ...], dtype: type = np.float64) -> np.ndarray:
+        """Gets the array for a quantity and shape, which is allocated on first use.
+
+        Args:
+            name: Name of the quantity stored in the array
+            shape: Shape of the array
+            dtype: Data type of the array. Defaults to float.
+
+        Returns:
+            An uninitialised array
+        """
+        key: tuple[str, tuple[int, ...]] = (name, shape)
+        try:
+            return self._arrays[key]
+        except KeyError:
+            array: np.ndarray = np.empty(shape, dtype=dtype)
+            self._arrays[key] = array
+
+            return array
+
+
 def profile_decorator(func):
     """Decorator to profile a function"""
 
@@ -21,10 +21,11 @@ from __future__ import annotations
 import logging
 
 import numpy as np
+import pytest
 
 from aragog import Solver, __version__, debug_logger
-
-# from aragog.output import Output
+from aragog.interfaces import PhaseEvaluatorProtocol
+from aragog.output import Output
 from aragog.utilities import profile_decorator
 
 logger: logging.Logger = debug_logger()
@@ -58,6 +59,26 @@ def test_liquid_no_heating(helper):
     assert np.isclose(calculated, expected, atol=helper.atol, rtol=helper.rtol).all()
 
 
+@profile_decorator
+def test_liquid_no_heating_lsoda(helper):
+    """Cooling of a purely molten magma ocean using LSODA with a banded Jacobian."""
+
+    with helper.get_cfg_file("abe_liquid.cfg") as cfg_file:
+        solver: Solver = Solver(cfg_file)
+
+    solver.parameters.solver.method = "LSODA"
+    solver.initialize()
+    solver.solve()
+    calculated: np.ndarray = solver.temperature_staggered[:, -1]
+
+    with helper.get_reference_file("abe_liquid_no_heating.dat") as reference_file:
+        expected: np.ndarray = np.loadtxt(reference_file)
+    logger.info("calculated = %s", calculated)
+    logger.info("expected = %s", expected)
+
+    assert np.isclose(calculated, expected, atol=helper.atol, rtol=helper.rtol).all()
+
+
 @profile_decorator
 def test_solid_no_heating(helper):
     """Cooling of a purely solid mantle."""
@@ -80,6 +101,42 @@ def test_solid_no_heating(helper):
     assert np.isclose(calculated, expected, atol=helper.atol, rtol=helper.rtol).all()
 
 
+def test_solid_convective_heat_flux_output(helper):
+    """Convective heat flux output for a mantle with constant properties."""
+
+    with helper.get_cfg_file("abe_solid.cfg") as cfg_file:
+        solver: Solver = Solver(cfg_file)
+
+    solver.initialize()
+    solver.solve()
+    output: Output = Output(solver)
+    output.state.update(output.solution.y, output.solution.t)
+    calculated: np.ndarray = output.convective_heat_flux_basic
+
+    phase: PhaseEvaluatorProtocol = output.state.phase_basic
+    expected: np.ndarray = (
+        -phase.density()
+        * phase.heat_capacity()
+        * output.state.eddy_diffusivity()
+        * (output.state.dTdr() - phase.dTdrs())
+        * output.parameters.scalings.heat_flux
+    )
+
+    assert calculated.shape == tuple(output.shape_basic)
+    assert np.isclose(calculated, expected, rtol=1e-12, atol=0).all()
+
+
+def test_unsupported_boundary_condition(helper):
+    """Boundary conditions that are not implemented are rejected when initializing."""
+
+    with helper.get_cfg_file("abe_liquid.cfg") as cfg_file:
+        solver: Solver = Solver(cfg_file)
+
+    solver.parameters.boundary_conditions.inner_boundary_condition = 1
+    with pytest.raises(NotImplementedError):
+        solver.initialize()
+
+
 @profile_decorator
 def test_solid_with_heating(helper):
     """Cooling of a purely solid mantle with radiogenic heating."""
@@ -0,0 +1,71 @@
+#
+# Copyright 2024 Dan J. Bower
+#
+# This file is part of Aragog.
+#
+# Aragog is free software: you can redistribute it and/or modify it under the terms of the GNU
+# General Public License as published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# Aragog is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without
+# even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Aragog. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Tests the transforms of the mesh."""
+
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+import pytest
+from scipy.sparse import csr_array
+
+from aragog import debug_logger
+from aragog.mesh import Mesh
+from aragog.parser import Parameters
+
+logger: logging.Logger = debug_logger()
+logger.setLevel(logging.INFO)
+
+
+@pytest.fixture(scope="module")
+def sparse_mesh(helper) -> Mesh:
+    """A mesh with enough nodes for the transforms to be stored as sparse matrices"""
+    with helper.get_cfg_file("abe_solid.cfg") as cfg_file:
+        parameters: Parameters = Parameters.from_file(cfg_file)
+    parameters.mesh.number_of_nodes = Mesh._SPARSE_TRANSFORM_NUMBER_OF_NODES + 50
+
+    return Mesh(parameters)
+
+
+@pytest.mark.parametrize("number_of_columns", [1, 3])
+def test_sparse_transforms(sparse_mesh: Mesh, number_of_columns: int):
+    """Sparse transforms agree with the dense transform matrices, with and without out."""
+
+    d_dr_transform: np.ndarray = sparse_mesh._get_d_dr_transform_matrix()
+    quantity_transform: np.ndarray = sparse_mesh._get_quantity_transform_matrix()
+    assert isinstance(sparse_mesh._d_dr_transform, csr_array)
+    assert isinstance(sparse_mesh._quantity_transform, csr_array)
+
+    rng: np.random.Generator = np.random.default_rng(0)
+    staggered_quantity: np.ndarray = rng.random(
+        (sparse_mesh.staggered.number_of_nodes, number_of_columns)
+    )
+    basic_shape: tuple[int, int] = (sparse_mesh.basic.number_of_nodes, number_of_columns)
+
+    for transform, method in (
+        (d_dr_transform, sparse_mesh.d_dr_at_basic_nodes),
+        (quantity_transform, sparse_mesh.quantity_at_basic_nodes),
+    ):
+        expected: np.ndarray = transform.dot(staggered_quantity)
+        calculated: np.ndarray = method(staggered_quantity)
+        assert np.allclose(calculated, expected, rtol=1e-14, atol=0)
+
+        out: np.ndarray = np.empty(basic_shape)
+        calculated = method(staggered_quantity, out=out)
+        assert calculated is out
+        assert np.allclose(out, expected, rtol=1e-14, atol=0)
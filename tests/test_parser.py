@@ -0,0 +1,244 @@
+#
+# Copyright 2024 Dan J. Bower
+#
+# This file is part of Aragog.
+#
+# Aragog is free software: you can redistribute it and/or modify it under the terms of the GNU
+# General Public License as published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# Aragog is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without
+# even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Aragog. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Tests parsing and scaling of the configuration data."""
+
+from __future__ import annotations
+
+import configparser
+import logging
+from dataclasses import fields
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy import constants
+from thermochem import codata
+
+from aragog import __version__, debug_logger
+from aragog.parser import (
+    Parameters,
+    _BoundaryConditionsParameters,
+    _ScalingsParameters,
+)
+
+logger: logging.Logger = debug_logger()
+logger.setLevel(logging.INFO)
+
+
+def test_version():
+    """Test version."""
+    assert __version__ == "0.1.0-alpha"
+
+
+def test_scalings():
+    """Derived scalings."""
+
+    radius: float = 6371e3
+    temperature: float = 3000
+    density: float = 4000
+    time: float = 1e6
+    scalings: _ScalingsParameters = _ScalingsParameters(
+        radius=radius, temperature=temperature, density=density, time=time
+    )
+
+    gravitational_acceleration: float = radius / np.square(time)
+    pressure: float = density * gravitational_acceleration * radius
+    velocity: float = radius / time
+    kinetic_energy_per_volume: float = density * np.square(velocity)
+    heat_capacity: float = kinetic_energy_per_volume / density / temperature
+    latent_heat_per_mass: float = heat_capacity * temperature
+    power_per_volume: float = kinetic_energy_per_volume / time
+    power_per_mass: float = power_per_volume / density
+    heat_flux: float = power_per_volume * radius
+    time_years: float = time / constants.Julian_year
+    expected: dict[str, float] = {
+        "area": np.square(radius),
+        "gravitational_acceleration": gravitational_acceleration,
+        "temperature_gradient": temperature / radius,
+        "thermal_expansivity": 1 / temperature,
+        "pressure": pressure,
+        "velocity": velocity,
+        "kinetic_energy_per_volume": kinetic_energy_per_volume,
+        "heat_capacity": heat_capacity,
+        "latent_heat_per_mass": latent_heat_per_mass,
+        "power_per_volume": power_per_volume,
+        "power_per_mass": power_per_mass,
+        "heat_flux": heat_flux,
+        "thermal_conductivity": power_per_volume * np.square(radius) / temperature,
+        "viscosity": pressure * time,
+        "time_years": time_years,
+        "stefan_boltzmann_constant": codata.value("Stefan-Boltzmann constant")
+        / (power_per_volume * radius / np.power(temperature, 4)),
+        "inverse_density": 1 / density,
+        "inverse_gravitational_acceleration": 1 / gravitational_acceleration,
+        "inverse_heat_capacity": 1 / heat_capacity,
+        "inverse_heat_flux": 1 / heat_flux,
+        "inverse_latent_heat_per_mass": 1 / latent_heat_per_mass,
+        "inverse_power_per_mass": 1 / power_per_mass,
+        "inverse_pressure": 1 / pressure,
+        "inverse_radius": 1 / radius,
+        "inverse_temperature": 1 / temperature,
+        "inverse_time_years": 1 / time_years,
+    }
+    derived_fields: list[str] = [
+        field_.name for field_ in fields(_ScalingsParameters) if not field_.init
+    ]
+
+    assert sorted(derived_fields) == sorted(expected)
+    for name, value in expected.items():
+        assert getattr(scalings, name) == pytest.approx(value, rel=1e-15), name
+
+
+def test_scale_boundary_conditions():
+    """Boundary values are scaled according to the boundary condition."""
+
+    scalings: _ScalingsParameters = _ScalingsParameters(
+        radius=6371e3, temperature=4000, density=4000, time=1e6
+    )
+    boundary_conditions: _BoundaryConditionsParameters = _BoundaryConditionsParameters(
+        outer_boundary_condition=5,
+        outer_boundary_value=2000,
+        inner_boundary_condition=2,
+        inner_boundary_value=1e-3,
+        emissivity=1,
+        equilibrium_temperature=273,
+        core_radius=3504e3,
+        core_density=10738,
+        core_heat_capacity=880,
+    )
+    boundary_conditions.scale_attributes(scalings)
+
+    assert np.isclose(boundary_conditions.outer_boundary_value, 0.5)
+    assert np.isclose(boundary_conditions.inner_boundary_value, 1e-3 / scalings.heat_flux)
+
+    boundary_conditions.outer_boundary_condition = 6
+    with pytest.raises(ValueError, match="outer_boundary_condition = 6 is unknown"):
+        boundary_conditions.scale_attributes(scalings)
+
+
+def test_parse_mixed(helper):
+    """Parses and scales the mixed phase configuration."""
+
+    with helper.get_cfg_file("abe_mixed.cfg") as cfg_file:
+        parameters: Parameters = Parameters.from_file(cfg_file)
+
+    assert parameters.scalings.radius == 6371000
+    assert parameters.mesh.number_of_nodes == 50
+    assert parameters.mesh.mixing_length_profile == "constant"
+    assert np.isclose(parameters.mesh.outer_radius, 1)
+    assert parameters.energy.conduction is True
+    assert parameters.energy.radionuclides is False
+    assert parameters.boundary_conditions.outer_boundary_condition == 1
+    assert np.isclose(parameters.boundary_conditions.equilibrium_temperature, 273 / 4000)
+    assert np.isclose(parameters.phase_liquid.density, 1)
+    assert parameters.phase_liquid.melt_fraction == 1
+    assert parameters.phase_mixed.solidus == "data/test/solidus_1d_lookup.dat"
+    assert np.isclose(parameters.solver.end_time, 2000)
+    assert parameters.solver.method == "BDF"
+    assert [radionuclide.name for radionuclide in parameters.radionuclides] == [
+        "K40",
+        "Th232",
+        "U235",
+        "U238",
+    ]
+    assert np.isclose(parameters.radionuclides[0].concentration, 310e-6)
+
+
+def test_parse_cached(helper):
+    """Parsing the same file again returns an independent copy of the parameters."""
+
+    with helper.get_cfg_file("abe_mixed.cfg") as cfg_file:
+        parameters: Parameters = Parameters.from_file(cfg_file)
+        parameters_again: Parameters = Parameters.from_file(cfg_file)
+
+    assert parameters_again == parameters
+    assert parameters_again is not parameters
+
+    parameters_again.energy.radionuclides = True
+
+    assert parameters.energy.radionuclides is False
+
+
+def test_parse_fallback(helper, tmp_path: Path):
+    """Configuration data with a DEFAULT section is parsed by the fallback parser."""
+
+    with helper.get_cfg_file("abe_solid.cfg") as cfg_file:
+        expected: Parameters = Parameters.from_file(cfg_file)
+        cfg_file_with_default: Path = tmp_path / "abe_solid_with_default.cfg"
+        cfg_file_with_default.write_text(
+            "[DEFAULT]\n\n" + cfg_file.read_text(encoding="utf-8"), encoding="utf-8"
+        )
+
+    calculated: Parameters = Parameters.from_file(cfg_file_with_default)
+
+    assert calculated == expected
+
+
+def test_parse_fallback_reuses_parser(helper, tmp_path: Path):
+    """A pooled fallback parser does not retain data from a previous configuration."""
+
+    calculated: dict[str, Parameters] = {}
+    expected: dict[str, Parameters] = {}
+    for cfg_name in ("abe_solid.cfg", "abe_mixed.cfg"):
+        with helper.get_cfg_file(cfg_name) as cfg_file:
+            expected[cfg_name] = Parameters.from_file(cfg_file)
+            cfg_file_with_default: Path = tmp_path / cfg_name
+            cfg_file_with_default.write_text(
+                "[DEFAULT]\n\n" + cfg_file.read_text(encoding="utf-8"), encoding="utf-8"
+            )
+        calculated[cfg_name] = Parameters.from_file(cfg_file_with_default)
+
+    assert calculated == expected
+
+
+def test_parse_fallback_interpolation(helper, tmp_path: Path):
+    """Configuration data with interpolation is parsed by the fallback parser."""
+
+    with helper.get_cfg_file("abe_solid.cfg") as cfg_file:
+        expected: Parameters = Parameters.from_file(cfg_file)
+        cfg_file_with_interpolation: Path = tmp_path / "abe_solid_with_interpolation.cfg"
+        cfg_file_with_interpolation.write_text(
+            cfg_file.read_text(encoding="utf-8")
+            .replace("[mesh]\n", "[mesh]\nnodes = 100\n")
+            .replace("number_of_nodes = 100", "number_of_nodes = %(nodes)s"),
+            encoding="utf-8",
+        )
+
+    calculated: Parameters = Parameters.from_file(cfg_file_with_interpolation)
+
+    assert calculated == expected
+
+
+@pytest.mark.parametrize(
+    "mesh_section, error",
+    [
+        ("[mesh]\nnumber_of_nodes = 10\n\n[mesh]\n", configparser.DuplicateSectionError),
+        ("[mesh]\nnumber_of_nodes = 10\n", configparser.DuplicateOptionError),
+    ],
+)
+def test_parse_duplicates(helper, tmp_path: Path, mesh_section: str, error: type[Exception]):
+    """Duplicate sections and options are rejected, as they are by configparser."""
+
+    with helper.get_cfg_file("abe_solid.cfg") as cfg_file:
+        cfg_file_with_duplicate: Path = tmp_path / "abe_solid_with_duplicate.cfg"
+        cfg_file_with_duplicate.write_text(
+            cfg_file.read_text(encoding="utf-8").replace("[mesh]\n", mesh_section),
+            encoding="utf-8",
+        )
+
+    with pytest.raises(error):
+        Parameters.from_file(cfg_file_with_duplicate)